@@ -1,53 +1,179 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import json
-import requests
+import copy
 import sqlite3
 from datetime import datetime, timedelta
 import subprocess
 import os
 import webbrowser
-from pathlib import Path
 import threading
-import shutil
-from collections import defaultdict
+import time
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+from collections import deque
 import csv
 import traceback
+import random
 
-# Try to import optional libraries
-try:
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except:
-    HAS_MATPLOTLIB = False
-
-try:
-    from fpdf import FPDF
-    HAS_PDF = True
-except:
-    HAS_PDF = False
+# Optional libraries are imported on first use to keep startup fast.
+# None means matplotlib has not been looked for yet.
+HAS_MATPLOTLIB = None
+
+def _load_matplotlib():
+    #Import matplotlib the first time charts are needed#
+    global HAS_MATPLOTLIB, Figure, FigureCanvasTkAgg, setp
+    if HAS_MATPLOTLIB is None:
+        try:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            # pyplot is skipped: charts only need setp, and it would also set up a backend
+            from matplotlib.artist import setp
+            HAS_MATPLOTLIB = True
+        except:
+            HAS_MATPLOTLIB = False
+    return HAS_MATPLOTLIB
+
+def _db_timestamp():
+    #Local time as the text sqlite3's default datetime adapter would store#
+    # Binding the string skips the adapter (deprecated since Python 3.12) on every row
+    return datetime.now().isoformat(sep=" ")
+
+# Color palettes; apply_theme copies the active one onto the workbench
+THEME_PALETTES = {
+    "dark": {
+        "bg_dark": "#2b2b2b",
+        "bg_medium": "#3c3f41",
+        "bg_light": "#4e5254",
+        "accent": "#4a9eff",
+        "accent_green": "#5fb363",
+        "accent_red": "#e74856",
+        "accent_orange": "#f59b42",
+        "text_color": "#ffffff",
+    },
+    "light": {
+        "bg_dark": "#f0f0f0",
+        "bg_medium": "#e0e0e0",
+        "bg_light": "#d0d0d0",
+        "accent": "#0078d4",
+        "accent_green": "#107c10",
+        "accent_red": "#d13438",
+        "accent_orange": "#ff8c00",
+        "text_color": "#000000",
+    },
+}
+
+# Parsed settings.json as (st_mtime_ns, dict); reparsed only when the file changes
+_SETTINGS_CACHE = None
+
+# Activity log entries are buffered and written in one transaction
+LOG_FLUSH_INTERVAL = 2000  # ms
+LOG_FLUSH_SIZE = 50
+SQL_INSERT_LOG = "INSERT INTO activity_log (action, details, timestamp) VALUES (?, ?, ?)"
+
+# Octopart price write-back; fixed text so sqlite3's statement cache reuses them
+SQL_UPDATE_PRICE = "UPDATE components SET unit_price = ?, lifecycle_status = ?, last_checked = ? WHERE id = ?"
+SQL_INSERT_PRICE_HISTORY = "INSERT INTO price_history (component_id, price, source) VALUES (?, ?, 'Octopart')"
+
+# Pages copied per step of an online backup
+BACKUP_PAGES_PER_STEP = 256
+
+# Interval between WAL checkpoints, in ms
+WAL_CHECKPOINT_INTERVAL = 5 * 60 * 1000
+
+# Delay before a search box keystroke triggers a query
+SEARCH_DEBOUNCE_MS = 150
+
+# Rows added to the components tree per page as the user scrolls
+COMPONENTS_PAGE_SIZE = 200
+
+# Sort key per components tree column; NULLs sort first, as empty cells did in the tree.
+# Pages are keyed on (key, mpn), so mpn breaks ties and keeps paging stable.
+COMPONENT_SORT_KEYS = {
+    "MPN": "mpn",
+    "Manufacturer": "lower(COALESCE(manufacturer, ''))",
+    "Description": "lower(COALESCE(description, ''))",
+    "Category": "lower(COALESCE(category, ''))",
+    "Stock": "COALESCE(stock_qty, -1e308)",
+    "Price": "COALESCE(unit_price, -1e308)",
+    "Lifecycle": "lower(COALESCE(lifecycle_status, ''))",
+    "Last Checked": "COALESCE(last_checked, '')",
+}
+
+# Components tree row tags; lifecycle takes precedence over low stock
+LIFECYCLE_ROW_TAGS = {'Obsolete': ('obsolete',), 'EOL': ('eol',), 'NRND': ('eol',)}
+LOW_STOCK_ROW_TAGS = ('lowstock',)
+
+# MPNs looked up per query when resolving an imported BOM
+IMPORT_LOOKUP_CHUNK = 500
+
+# Alerts panel lists at most this many rows per section
+ALERT_DETAIL_LIMIT = 20
+
+# Octopart batches several MPNs into one GraphQL request
+OCTOPART_URL = "https://octopart.com/api/v4/endpoint"
+OCTOPART_BATCH_SIZE = 20
+# Concurrent Octopart requests
+OCTOPART_WORKERS = 16
+OCTOPART_MULTI_MATCH_QUERY = '''
+    query ($queries: [PartMatchQuery!]!) {
+        multi_match(queries: $queries) {
+            parts { mpn manufacturer { name } median_price_1000 { price } }
+        }
+    }
+'''
+
+# One BOM line of the HTML report, filled in with str.format per row
+REPORT_ROW_HTML = '''
+                    <tr{cls}>
+                        <td>{ref}</td>
+                        <td>{mpn}</td>
+                        <td>{mfg}</td>
+                        <td>{desc}</td>
+                        <td>{qty}</td>
+                        <td>${unit:.2f}</td>
+                        <td>${ext:.2f}</td>
+                        <td>{lifecycle}</td>
+                        <td>{datasheet}</td>
+                    </tr>
+                    '''
 
 class HardwareEngineeringWorkbench:
     def __init__(self, root):
         self.root = root
         self.root.title("Hardware Engineering Workbench v2.0")
         self.root.geometry("1400x900")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Load settings
         self.settings = self.load_settings()
+        # Last serialized settings; save_settings skips the write when unchanged
+        self._saved_settings = json.dumps(self.settings, indent=2)
+    
+        # Stat card value labels and the counts they show, keyed by card title
+        self.stat_labels = {}
+        self._last_stats = {}
+        
+        # Dashboard view cache, keyed by _view_version()
+        self._db_version = 0
+        self._cache = {}
     
         # Initialize database
         self.init_database()
     
         # Auto-backup
+        self._backup_lock = threading.Lock()
+        self._last_backup_version = None
         self.setup_auto_backup()
+        self.root.after(WAL_CHECKPOINT_INTERVAL, self.wal_checkpoint)
     
         # Color scheme
         self.apply_theme()
+        self._install_styles()
     
         # Status bar
+        self._pending_status = None
+        self._status_scheduled = False
         self.create_status_bar()
     
         # Create main interface
@@ -75,11 +201,13 @@ class HardwareEngineeringWorkbench:
             "recent_projects": []
         }
     
+        global _SETTINGS_CACHE
         try:
-            if os.path.exists("settings.json"):
+            mtime = os.stat("settings.json").st_mtime_ns
+            if _SETTINGS_CACHE is None or _SETTINGS_CACHE[0] != mtime:
                 with open("settings.json", "r") as f:
-                    loaded = json.load(f)
-                    default_settings.update(loaded)
+                    _SETTINGS_CACHE = (mtime, json.load(f))
+            default_settings.update(copy.deepcopy(_SETTINGS_CACHE[1]))
         except:
             pass
     
@@ -87,35 +215,54 @@ class HardwareEngineeringWorkbench:
 
     def save_settings(self):
         #Save settings to JSON file#
+        text = json.dumps(self.settings, indent=2)
+        if text == self._saved_settings:
+            return
         try:
-            with open("settings.json", "w") as f:
-                json.dump(self.settings, f, indent=2)
+            # Write a temp file and swap it in so a crash can't leave half a file
+            with open("settings.json.tmp", "w") as f:
+                f.write(text)
+            os.replace("settings.json.tmp", "settings.json")
+            self._saved_settings = text
         except Exception as e:
             print(f"Failed to save settings: {e}")
 
     def apply_theme(self):
         #Apply color theme#
-        if self.settings["theme"] == "dark":
-            self.bg_dark = "#2b2b2b"
-            self.bg_medium = "#3c3f41"
-            self.bg_light = "#4e5254"
-            self.accent = "#4a9eff"
-            self.accent_green = "#5fb363"
-            self.accent_red = "#e74856"
-            self.accent_orange = "#f59b42"
-            self.text_color = "#ffffff"
-        else:  # light theme
-            self.bg_dark = "#f0f0f0"
-            self.bg_medium = "#e0e0e0"
-            self.bg_light = "#d0d0d0"
-            self.accent = "#0078d4"
-            self.accent_green = "#107c10"
-            self.accent_red = "#d13438"
-            self.accent_orange = "#ff8c00"
-            self.text_color = "#000000"
-    
+        theme = "dark" if self.settings["theme"] == "dark" else "light"
+        for key, color in THEME_PALETTES[theme].items():
+            setattr(self, key, color)
+        self._current_palette = theme.capitalize()
+        # Chart colors per lifecycle status, rebuilt only when the palette changes
+        self.lifecycle_colors = {
+            'Active': self.accent_green,
+            'NRND': self.accent_orange,
+            'EOL': self.accent_orange,
+            'Obsolete': self.accent_red
+        }
+        
         self.root.configure(bg=self.bg_dark)
 
+    def _install_styles(self):
+        #Define a named ttk style per palette once; switching themes only swaps style names#
+        style = ttk.Style()
+        style.theme_use('clam')
+        for theme, palette in THEME_PALETTES.items():
+            name = theme.capitalize()
+            style.configure(f'{name}.TNotebook', background=palette["bg_dark"])
+            style.configure(f'{name}.TNotebook.Tab', background=palette["bg_medium"],
+                            foreground=palette["text_color"], padding=[20, 10])
+            style.map(f'{name}.TNotebook.Tab', background=[('selected', palette["accent"])])
+        
+        # (widget, base style) pairs restyled by toggle_theme
+        self._styled_widgets = []
+
+    def _styled(self, widget, base):
+        #Give a ttk widget the current palette's style and track it for theme switches#
+        widget.configure(style=f"{self._current_palette}.{base}")
+        self._styled_widgets.append((widget, base))
+        return widget
+
     def create_status_bar(self):
         #Create status bar at bottom#
         self.status_bar = tk.Frame(self.root, bg=self.bg_medium, height=25)
@@ -129,13 +276,21 @@ class HardwareEngineeringWorkbench:
         self.progress.pack(side=tk.RIGHT, padx=10)
 
     def set_status(self, message, working=False):
-        #Update status bar#
+        #Update status bar; bursts of calls collapse into one redraw when Tk idles#
+        self._pending_status = (message, working)
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after_idle(self._apply_status)
+
+    def _apply_status(self):
+        #Show the latest status passed to set_status#
+        self._status_scheduled = False
+        message, working = self._pending_status
         self.status_label.config(text=message)
         if working:
             self.progress.start()
         else:
             self.progress.stop()
-        self.root.update_idletasks()
 
     def setup_shortcuts(self):
         #Setup keyboard shortcuts#
@@ -148,8 +303,9 @@ class HardwareEngineeringWorkbench:
 
     def focus_search(self):
         #Focus on search box#
-        if hasattr(self, 'component_search'):
-            self.component_search.focus()
+        self.notebook.select(1)  # Components tab
+        self._materialize_tab()
+        self.component_search.focus()
 
     def refresh_all(self):
         #Refresh all views#
@@ -165,35 +321,81 @@ class HardwareEngineeringWorkbench:
             self.root.after(interval, self.auto_backup)
 
     def auto_backup(self):
-        #Perform automatic backup#
+        #Perform automatic backup on a worker thread#
+        # Nothing changed since the last good backup, so skip the copy
+        if self._db_version != self._last_backup_version:
+            threading.Thread(target=self._do_backup, args=(self._db_version,), daemon=True).start()
+    
+        # Schedule next backup
+        if self.settings.get("auto_backup", True):
+            interval = self.settings.get("backup_interval", 30) * 60000
+            self.root.after(interval, self.auto_backup)
+
+    def _do_backup(self, db_version=None):
+        #Copy the database with the online backup API and rotate old backups#
+        # Skip this run if the previous backup is still copying
+        if not self._backup_lock.acquire(blocking=False):
+            return
         try:
             backup_dir = "backups"
             os.makedirs(backup_dir, exist_ok=True)
-        
+            
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = f"{backup_dir}/hardware_workbench_{timestamp}.db"
+            
+            self._copy_database(backup_file)
         
-            shutil.copy2("hardware_workbench.db", backup_file)
-        
-            # Keep only last 10 backups
-            backups = sorted(Path(backup_dir).glob("*.db"))
-            if len(backups) > 10:
-                for old_backup in backups[:-10]:
-                    old_backup.unlink()
+            # Keep only last 10 backups; timestamped names sort oldest first without a stat() each
+            backups = [entry for entry in os.scandir(backup_dir) if entry.name.endswith(".db")]
+            for old_backup in heapq.nsmallest(len(backups) - 10, backups, key=lambda entry: entry.name):
+                os.unlink(old_backup.path)
+            
+            self._last_backup_version = db_version
         
-            self.set_status(f"Auto-backup completed: {timestamp}", False)
+            self.root.after(0, self.set_status, f"Auto-backup completed: {timestamp}", False)
         except Exception as e:
             print(f"Auto-backup failed: {e}")
-    
-        # Schedule next backup
-        if self.settings.get("auto_backup", True):
-            interval = self.settings.get("backup_interval", 30) * 60000
-            self.root.after(interval, self.auto_backup)
+        finally:
+            self._backup_lock.release()
+
+    def _copy_database(self, backup_file):
+        #Snapshot the live database into backup_file (worker thread)#
+        # sqlite3 connections are bound to their thread, so use private ones.
+        # Copying BACKUP_PAGES_PER_STEP pages at a time lets UI writes in between.
+        src = sqlite3.connect('hardware_workbench.db')
+        dst = sqlite3.connect(backup_file)
+        try:
+            src.backup(dst, pages=BACKUP_PAGES_PER_STEP, sleep=0.001)
+        finally:
+            dst.close()
+            src.close()
+
+    def wal_checkpoint(self):
+        #Truncate the WAL file on a worker thread so it can't grow without bound#
+        threading.Thread(target=self._do_wal_checkpoint, daemon=True).start()
+        self.root.after(WAL_CHECKPOINT_INTERVAL, self.wal_checkpoint)
+
+    def _do_wal_checkpoint(self):
+        #Checkpoint through a private connection without holding off the Tk thread's writes#
+        # TRUNCATE holds the writer lock while it waits, and the main connection would block
+        # behind it. So copy frames with PASSIVE (never blocks writers) and only truncate once
+        # every frame is back in the database, with timeout=0 so a busy reader fails it at once.
+        try:
+            conn = sqlite3.connect('hardware_workbench.db', timeout=0)
+            try:
+                busy, log_frames, checkpointed = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+                if not busy and log_frames == checkpointed:
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"WAL checkpoint failed: {e}")
 
     def init_database(self):
         #Initialize SQLite database with enhanced schema#
-        self.conn = sqlite3.connect('hardware_workbench.db')
-        self.cursor = self.conn.cursor()
+        self._open_db()
+        self._log_buffer = deque()
+        self._log_flush_id = None
     
         # Components table (enhanced)
         self.cursor.execute('''
@@ -215,18 +417,39 @@ class HardwareEngineeringWorkbench:
                 created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+        # Partial indexes for the dashboard alert queries
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_comp_lowstock ON components(stock_qty, min_stock)
+            WHERE min_stock > 0
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_comp_lifecycle ON components(lifecycle_status)
+            WHERE lifecycle_status IN ('Obsolete', 'EOL', 'NRND')
+        ''')
+        # The Obsolete Parts card and startup check can't use the NRND-inclusive index above
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_comp_retired ON components(lifecycle_status)
+            WHERE lifecycle_status IN ('Obsolete', 'EOL')
+        ''')
+        # Category filter pages (category = ? AND mpn > ? ORDER BY mpn) and the category charts
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_comp_category_mpn ON components(category, mpn)"
+        )
     
+        self._init_search_index()
+        
         # Price history table (NEW)
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS price_history (
-                id INTEGER PRIMARY KEY,
-                component_id INTEGER,
-                price REAL,
-                date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                source TEXT,
-                FOREIGN KEY (component_id) REFERENCES components(id)
-            )
+        self._create_cascading_table("price_history", '''
+            id INTEGER PRIMARY KEY,
+            component_id INTEGER,
+            price REAL,
+            date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            source TEXT,
+            FOREIGN KEY (component_id) REFERENCES components(id) ON DELETE CASCADE
         ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ph_comp_date ON price_history(component_id, date)"
+        )
     
         # Suppliers table (NEW)
         self.cursor.execute('''
@@ -240,20 +463,24 @@ class HardwareEngineeringWorkbench:
         ''')
     
         # Component-Supplier link (NEW)
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS component_suppliers (
-                id INTEGER PRIMARY KEY,
-                component_id INTEGER,
-                supplier_id INTEGER,
-                supplier_mpn TEXT,
-                price REAL,
-                moq INTEGER,
-                lead_time_days INTEGER,
-                last_updated TIMESTAMP,
-                FOREIGN KEY (component_id) REFERENCES components(id),
-                FOREIGN KEY (supplier_id) REFERENCES suppliers(id)
-            )
+        self._create_cascading_table("component_suppliers", '''
+            id INTEGER PRIMARY KEY,
+            component_id INTEGER,
+            supplier_id INTEGER,
+            supplier_mpn TEXT,
+            price REAL,
+            moq INTEGER,
+            lead_time_days INTEGER,
+            last_updated TIMESTAMP,
+            FOREIGN KEY (component_id) REFERENCES components(id) ON DELETE CASCADE,
+            FOREIGN KEY (supplier_id) REFERENCES suppliers(id) ON DELETE CASCADE
         ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cs_component ON component_suppliers(component_id)"
+        )
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cs_supplier ON component_suppliers(supplier_id)"
+        )
     
         # Projects table
         self.cursor.execute('''
@@ -268,20 +495,26 @@ class HardwareEngineeringWorkbench:
                 last_opened TIMESTAMP
             )
         ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_proj_last_opened ON projects(last_opened DESC)"
+        )
     
         # BOM table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bom (
-                id INTEGER PRIMARY KEY,
-                project_id INTEGER,
-                component_id INTEGER,
-                reference_designator TEXT,
-                quantity INTEGER,
-                do_not_populate INTEGER DEFAULT 0,
-                FOREIGN KEY (project_id) REFERENCES projects(id),
-                FOREIGN KEY (component_id) REFERENCES components(id)
-            )
+        self._create_cascading_table("bom", '''
+            id INTEGER PRIMARY KEY,
+            project_id INTEGER,
+            component_id INTEGER,
+            reference_designator TEXT,
+            quantity INTEGER,
+            do_not_populate INTEGER DEFAULT 0,
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            FOREIGN KEY (component_id) REFERENCES components(id) ON DELETE CASCADE
         ''')
+        # BOM lookups by project; also yields report rows already ordered by reference designator
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bom_project_refdes ON bom(project_id, reference_designator)"
+        )
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_bom_component ON bom(component_id)")
     
         # Activity log (NEW)
         self.cursor.execute('''
@@ -293,17 +526,171 @@ class HardwareEngineeringWorkbench:
             )
         ''')
     
+        # Gather planner statistics the first time so the partial indexes get used
+        has_stats = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            self.cursor.execute("ANALYZE")
+    
+        self.conn.commit()
+
+    def _create_cascading_table(self, name, columns):
+        #Create a child table whose foreign keys cascade, rebuilding tables made before they did#
+        row = self.cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (name,)
+        ).fetchone()
+        # A leftover {name}_old means an earlier rebuild was interrupted; finish copying it
+        has_old = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (f"{name}_old",)
+        ).fetchone() is not None
+        if row is None and not has_old:
+            self.cursor.execute(f"CREATE TABLE {name} ({columns})")
+            return
+        if row is not None and "ON DELETE CASCADE" in row[0] and not has_old:
+            return
+    
+        # SQLite can't alter a foreign key in place, so copy into a new table.
+        # Enforcement is off meanwhile so rows left by older versions survive;
+        # the PRAGMA is a no-op inside a transaction, so set it before BEGIN.
+        self.conn.commit()
+        self.cursor.execute("PRAGMA foreign_keys=OFF")
+        try:
+            # DDL is transactional, so a crash part-way leaves the original table intact
+            self.cursor.execute("BEGIN")
+            try:
+                if not has_old:
+                    self.cursor.execute(f"ALTER TABLE {name} RENAME TO {name}_old")
+                    row = None
+                if row is None:
+                    self.cursor.execute(f"CREATE TABLE {name} ({columns})")
+                new_cols = [c[1] for c in self.cursor.execute(f"PRAGMA table_info({name})")]
+                old_cols = {c[1] for c in self.cursor.execute(f"PRAGMA table_info({name}_old)")}
+                cols = ", ".join(c for c in new_cols if c in old_cols)
+                # OR IGNORE: a resumed copy may find rows already added under the same id
+                self.cursor.execute(
+                    f"INSERT OR IGNORE INTO {name} ({cols}) SELECT {cols} FROM {name}_old"
+                )
+                self.cursor.execute(f"DROP TABLE {name}_old")
+                self.conn.commit()
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
+        finally:
+            self.cursor.execute("PRAGMA foreign_keys=ON")
+
+    def _init_search_index(self):
+        #Create the FTS5 index for component search, kept in sync by triggers#
+        exists = self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='components_fts'"
+        ).fetchone()
+        try:
+            # trigram keeps the substring semantics of the old LIKE '%...%' search
+            self.cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS components_fts USING fts5(
+                    mpn, manufacturer, description,
+                    content='components', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5/trigram, search falls back to LIKE
+            self.has_fts = False
+            return
+        
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS components_fts_ai AFTER INSERT ON components BEGIN
+                INSERT INTO components_fts(rowid, mpn, manufacturer, description)
+                VALUES (new.id, new.mpn, new.manufacturer, new.description);
+            END
+        ''')
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS components_fts_ad AFTER DELETE ON components BEGIN
+                INSERT INTO components_fts(components_fts, rowid, mpn, manufacturer, description)
+                VALUES ('delete', old.id, old.mpn, old.manufacturer, old.description);
+            END
+        ''')
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS components_fts_au AFTER UPDATE OF mpn, manufacturer, description
+            ON components BEGIN
+                INSERT INTO components_fts(components_fts, rowid, mpn, manufacturer, description)
+                VALUES ('delete', old.id, old.mpn, old.manufacturer, old.description);
+                INSERT INTO components_fts(rowid, mpn, manufacturer, description)
+                VALUES (new.id, new.mpn, new.manufacturer, new.description);
+            END
+        ''')
+        if not exists:
+            self.cursor.execute("INSERT INTO components_fts(components_fts) VALUES ('rebuild')")
         self.conn.commit()
+        self.has_fts = True
+
+    def _open_db(self):
+        #Open the workbench database; a larger statement cache keeps hot queries prepared#
+        self.conn = sqlite3.connect('hardware_workbench.db', cached_statements=256)
+        self.cursor = self.conn.cursor()
+        self._configure_conn()
+
+    def _configure_conn(self):
+        #Apply connection PRAGMAs (WAL persists in the file, the rest are per-connection)#
+        self.conn.row_factory = sqlite3.Row
+        self.cursor.row_factory = sqlite3.Row
+        self.cursor.arraysize = 1000
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        self.cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+        self.cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        # WAL readers never block writers; this waits out other writers and checkpointers
+        # (_do_wal_checkpoint, restore) instead of failing with "database is locked"
+        self.cursor.execute("PRAGMA busy_timeout=60000")
+        # Deleting a project or component cascades to its BOM, price and supplier rows
+        self.cursor.execute("PRAGMA foreign_keys=ON")
 
     def log_activity(self, action, details=""):
-        #Log user activity#
+        #Queue user activity; written in batches by _flush_log#
+        # Stamp now in CURRENT_TIMESTAMP's UTC format, not when the batch is written
+        self._log_buffer.append((action, details, time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())))
+        if len(self._log_buffer) >= LOG_FLUSH_SIZE:
+            self._flush_log()
+        elif self._log_flush_id is None:
+            self._log_flush_id = self.root.after(LOG_FLUSH_INTERVAL, self._flush_log)
+
+    def _flush_log(self):
+        #Write buffered activity log entries in a single transaction#
+        if self._log_flush_id is not None:
+            self.root.after_cancel(self._log_flush_id)
+            self._log_flush_id = None
+        if not self._log_buffer:
+            return
         try:
-            self.cursor.execute(
-                "INSERT INTO activity_log (action, details) VALUES (?, ?)", (action, details)
-            )
+            self.cursor.executemany(SQL_INSERT_LOG, list(self._log_buffer))
             self.conn.commit()
-        except:
-            pass
+            self._log_buffer.clear()
+        except sqlite3.Error as e:
+            # Drop the partial batch so a later commit can't persist it next to the retry
+            self.conn.rollback()
+            print(f"Failed to flush activity log: {e}")
+
+    def _mark_dirty(self):
+        #Invalidate cached dashboard views after a data change#
+        self._db_version += 1
+
+    def _view_version(self):
+        #Cache key for dashboard views; data_version also catches commits from other connections#
+        data_version = self.cursor.execute("PRAGMA data_version").fetchone()[0]
+        return (self._db_version, data_version)
+
+    def _on_close(self):
+        #Flush pending writes before the window closes#
+        try:
+            self._flush_log()
+            # Refresh planner statistics that have gone stale since ANALYZE
+            self.cursor.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            print(f"PRAGMA optimize failed: {e}")
+        finally:
+            # Always let the window close, even if the database is locked or unwritable
+            self.conn.close()
+            self.root.destroy()
 
     def create_menu(self):
         #Create enhanced menu bar#
@@ -320,7 +707,7 @@ class HardwareEngineeringWorkbench:
         file_menu.add_command(label="Backup Database", command=self.manual_backup)
         file_menu.add_command(label="Restore from Backup", command=self.restore_backup)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
     
         # Edit menu
         edit_menu = tk.Menu(menubar, tearoff=0, bg=self.bg_medium, fg=self.text_color)
@@ -356,27 +743,34 @@ class HardwareEngineeringWorkbench:
 
     def create_main_layout(self):
         #Create main tabbed interface#
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TNotebook', background=self.bg_dark)
-        style.configure('TNotebook.Tab', background=self.bg_medium, foreground=self.text_color, padding=[20, 10])
-        style.map('TNotebook.Tab', background=[('selected', self.accent)])
-    
-        self.notebook = ttk.Notebook(self.root)
+        self.notebook = self._styled(ttk.Notebook(self.root), "TNotebook")
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
     
-        # Create tabs
-        self.create_dashboard_tab()
-        self.create_components_tab()
-        self.create_bom_tab()
-        self.create_projects_tab()
-        self.create_analytics_tab()  # NEW
-        self.create_tools_tab()
-
-    def create_dashboard_tab(self):
+        # Create tabs; each starts as an empty frame and is built when first shown
+        self._tab_builders = {}
+        for title, builder in [
+            ("📊 Dashboard", self.create_dashboard_tab),
+            ("🔌 Components", self.create_components_tab),
+            ("📋 BOM Manager", self.create_bom_tab),
+            ("📁 Projects", self.create_projects_tab),
+            ("📈 Analytics", self.create_analytics_tab),  # NEW
+            ("🔧 Tools", self.create_tools_tab),
+        ]:
+            frame = tk.Frame(self.notebook, bg=self.bg_dark)
+            self.notebook.add(frame, text=title)
+            self._tab_builders[str(frame)] = (frame, builder)
+        self.notebook.bind('<<NotebookTabChanged>>', self._materialize_tab)
+        self._materialize_tab()
+
+    def _materialize_tab(self, event=None):
+        #Build the selected tab the first time it is shown#
+        entry = self._tab_builders.pop(str(self.notebook.select()), None)
+        if entry:
+            frame, builder = entry
+            builder(frame)
+
+    def create_dashboard_tab(self, dashboard):
         #Enhanced dashboard with recent projects and alerts#
-        dashboard = tk.Frame(self.notebook, bg=self.bg_dark)
-        self.notebook.add(dashboard, text="📊 Dashboard")
     
         # Header
         header = tk.Label(dashboard, text="Hardware Engineering Workbench", 
@@ -444,7 +838,8 @@ class HardwareEngineeringWorkbench:
         label = tk.Label(card, text=value, font=("Arial", 28, "bold"), bg=self.bg_medium, fg=self.accent)
         label.pack()
         
-        setattr(self, f"stat_{title.lower().replace(' ', '_')}", label)
+        self.stat_labels[title] = label
+        self._last_stats.pop(title, None)  # New label, so the next update must write it
 
     def create_action_button(self, parent, text, command, row, col):
         #Create action button with tooltip#
@@ -461,6 +856,9 @@ class HardwareEngineeringWorkbench:
 
     def update_recent_projects(self):
         #Update recent projects list#
+        version = self._view_version()
+        if self._cache.get("recent_projects") == version:
+            return
         self.recent_projects_list.delete(0, tk.END)
         
         recent = self.cursor.execute('''
@@ -469,62 +867,86 @@ class HardwareEngineeringWorkbench:
             ORDER BY last_opened DESC LIMIT 10
         ''').fetchall()
         
-        for name, last_opened in recent:
-            self.recent_projects_list.insert(tk.END, f"  {name}")
+        if recent:
+            self.recent_projects_list.insert(tk.END, *(f"  {name}" for name, last_opened in recent))
+        
+        self._cache["recent_projects"] = version
 
     def update_alerts(self):
         #Update alerts panel#
+        version = self._view_version()
+        if self._cache.get("alerts") == version:
+            return
         self.alerts_text.delete("1.0", tk.END)
         
-        # Low stock alerts
-        low_stock = self.cursor.execute('''
-            SELECT mpn, stock_qty, min_stock FROM components 
-            WHERE stock_qty < min_stock AND min_stock > 0
-        ''').fetchall()
+        # Count first; detail rows are only fetched for non-empty sections
+        low_stock, obsolete = self.cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM components WHERE stock_qty < min_stock AND min_stock > 0),
+                (SELECT COUNT(*) FROM components WHERE lifecycle_status IN ('Obsolete', 'EOL', 'NRND'))
+        ''').fetchone()
         
+        # (text, tags) pairs, written with a single insert at the end
+        parts = []
+        
+        # Low stock alerts
         if low_stock:
-            self.alerts_text.insert(tk.END, "⚠️ LOW STOCK WARNINGS:\n", "warning")
-            for mpn, qty, min_qty in low_stock:
-                self.alerts_text.insert(tk.END, f"  • {mpn}: {qty} (min: {min_qty})\n")
-            self.alerts_text.insert(tk.END, "\n")
+            rows = self.cursor.execute('''
+                SELECT mpn, stock_qty, min_stock FROM components 
+                WHERE stock_qty < min_stock AND min_stock > 0
+                LIMIT ?
+            ''', (ALERT_DETAIL_LIMIT,)).fetchall()
+            lines = "".join(f"  • {mpn}: {qty} (min: {min_qty})\n" for mpn, qty, min_qty in rows)
+            if low_stock > len(rows):
+                lines += f"  … and {low_stock - len(rows)} more\n"
+            parts += ["⚠️ LOW STOCK WARNINGS:\n", "warning", lines + "\n", ""]
         
         # Obsolete parts
-        obsolete = self.cursor.execute('''
-            SELECT mpn, lifecycle_status FROM components 
-            WHERE lifecycle_status IN ('Obsolete', 'EOL', 'NRND')
-        ''').fetchall()
-        
         if obsolete:
-            self.alerts_text.insert(tk.END, "🚫 LIFECYCLE ALERTS:\n", "error")
-            for mpn, status in obsolete:
-                self.alerts_text.insert(tk.END, f"  • {mpn}: {status}\n")
-            self.alerts_text.insert(tk.END, "\n")
-        
-        # Price increases
+            rows = self.cursor.execute('''
+                SELECT mpn, lifecycle_status FROM components 
+                WHERE lifecycle_status IN ('Obsolete', 'EOL', 'NRND')
+                LIMIT ?
+            ''', (ALERT_DETAIL_LIMIT,)).fetchall()
+            lines = "".join(f"  • {mpn}: {status}\n" for mpn, status in rows)
+            if obsolete > len(rows):
+                lines += f"  … and {obsolete - len(rows)} more\n"
+            parts += ["🚫 LIFECYCLE ALERTS:\n", "error", lines + "\n", ""]
+        
+        # Price increases (first vs latest recorded price, one pass over price_history)
         price_changes = self.cursor.execute('''
-            SELECT c.mpn, ph1.price as old_price, ph2.price as new_price
+            WITH ranked AS (
+                SELECT component_id, price,
+                    ROW_NUMBER() OVER (PARTITION BY component_id ORDER BY date, id) AS rn_asc,
+                    ROW_NUMBER() OVER (PARTITION BY component_id ORDER BY date DESC, id DESC) AS rn_desc
+                FROM price_history
+            )
+            SELECT c.mpn, a.price as old_price, b.price as new_price
             FROM components c
-            JOIN price_history ph1 ON c.id = ph1.component_id
-            JOIN price_history ph2 ON c.id = ph2.component_id
-            WHERE ph2.date > ph1.date
-            AND ph2.price > ph1.price * 1.1
-            GROUP BY c.mpn
+            JOIN ranked a ON a.component_id = c.id AND a.rn_asc = 1
+            JOIN ranked b ON b.component_id = c.id AND b.rn_desc = 1
+            WHERE b.price > a.price * 1.1
+            ORDER BY c.mpn
+            LIMIT 5
         ''').fetchall()
         
         if price_changes:
-            self.alerts_text.insert(tk.END, "💰 PRICE INCREASES (>10%):\n", "info")
-            for mpn, old, new in price_changes[:5]:
-                change = ((new - old) / old) * 100
-                self.alerts_text.insert(tk.END, f"  • {mpn}: ${old:.2f} → ${new:.2f} (+{change:.1f}%)\n")
+            lines = "".join(f"  • {mpn}: ${old:.2f} → ${new:.2f} (+{(new - old) / old * 100:.1f}%)\n"
+                            for mpn, old, new in price_changes)
+            parts += ["💰 PRICE INCREASES (>10%):\n", "info", lines, ""]
         
         if not low_stock and not obsolete and not price_changes:
-            self.alerts_text.insert(tk.END, "✓ All systems normal\nNo alerts at this time", "success")
+            parts += ["✓ All systems normal\nNo alerts at this time", "success"]
+        
+        self.alerts_text.insert(tk.END, *parts)
         
         # Configure tags
         self.alerts_text.tag_config("warning", foreground=self.accent_orange, font=("Arial", 10, "bold"))
         self.alerts_text.tag_config("error", foreground=self.accent_red, font=("Arial", 10, "bold"))
         self.alerts_text.tag_config("info", foreground=self.accent, font=("Arial", 10, "bold"))
         self.alerts_text.tag_config("success", foreground=self.accent_green, font=("Arial", 10, "bold"))
+        
+        self._cache["alerts"] = version
 
     def open_recent_project(self, event):
         #Open recently selected project#
@@ -533,17 +955,16 @@ class HardwareEngineeringWorkbench:
             project_name = self.recent_projects_list.get(selection[0]).strip()
             # Switch to projects tab and open it
             self.notebook.select(3)  # Projects tab
+            self._materialize_tab()
             self.set_status(f"Opening project: {project_name}", False)
 
-    def create_analytics_tab(self):
+    def create_analytics_tab(self, analytics):
         #NEW: Analytics tab with charts#
-        analytics = tk.Frame(self.notebook, bg=self.bg_dark)
-        self.notebook.add(analytics, text="📈 Analytics")
         
         tk.Label(analytics, text="Cost & Inventory Analytics", 
                 font=("Arial", 18, "bold"), bg=self.bg_dark, fg=self.text_color).pack(pady=20)
         
-        if not HAS_MATPLOTLIB:
+        if not _load_matplotlib():
             tk.Label(analytics, text="Install matplotlib for charts:\npip install matplotlib",
                     font=("Arial", 14), bg=self.bg_dark, fg=self.accent_orange).pack(pady=50)
             return
@@ -575,6 +996,8 @@ class HardwareEngineeringWorkbench:
         
         # Chart canvas
         self.chart_container = tk.Frame(analytics, bg=self.bg_dark)
+        # chart type -> (view version, canvas); switching back to a chart reuses it
+        self._chart_cache = {}
         self.chart_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
         self.update_chart()
@@ -584,11 +1007,19 @@ class HardwareEngineeringWorkbench:
         if not HAS_MATPLOTLIB:
             return
         
-        # Clear previous chart
-        for widget in self.chart_container.winfo_children():
-            widget.destroy()
-        
         chart_type = self.chart_var.get()
+        version = self._view_version()
+        
+        # Hide the current chart and drop cached ones drawn from older data
+        for cached_type, (cached_version, cached_canvas) in list(self._chart_cache.items()):
+            cached_canvas.get_tk_widget().pack_forget()
+            if cached_version != version:
+                cached_canvas.get_tk_widget().destroy()
+                del self._chart_cache[cached_type]
+        
+        if chart_type in self._chart_cache:
+            self._chart_cache[chart_type][1].get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            return
         
         fig = Figure(figsize=(10, 6), facecolor=self.bg_dark)
         ax = fig.add_subplot(111)
@@ -610,26 +1041,23 @@ class HardwareEngineeringWorkbench:
             ''').fetchall()
             
             if data:
-                categories = [d[0] or "Uncategorized" for d in data]
-                values = [d[1] for d in data]
+                categories, values = zip(*data)
                 ax.bar(categories, values, color=self.accent)
                 ax.set_xlabel('Category', color=self.text_color)
                 ax.set_ylabel('Total Value ($)', color=self.text_color)
                 ax.set_title('Inventory Value by Category', color=self.text_color, fontsize=14, fontweight='bold')
-                plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+                setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
         elif chart_type == "Component Count by Category":
             data = self.cursor.execute('''
-                SELECT category, COUNT(*) as count
+                SELECT COALESCE(NULLIF(category, ''), 'Uncategorized') as category, COUNT(*) as count
                 FROM components
-                WHERE category != ''
-                GROUP BY category
+                GROUP BY 1
                 ORDER BY count DESC
             ''').fetchall()
             
             if data:
-                categories = [d[0] or "Uncategorized" for d in data]
-                counts = [d[1] for d in data]
+                categories, counts = zip(*data)
                 colors = [self.accent, self.accent_green, self.accent_orange, '#9b59b6', '#e67e22']
                 ax.pie(counts, labels=categories, autopct='%1.1f%%', startangle=90, 
                     colors=colors[:len(counts)])
@@ -637,21 +1065,14 @@ class HardwareEngineeringWorkbench:
         
         elif chart_type == "Lifecycle Status Distribution":
             data = self.cursor.execute('''
-                SELECT lifecycle_status, COUNT(*) as count
+                SELECT COALESCE(NULLIF(lifecycle_status, ''), 'Unknown') as status, COUNT(*) as count
                 FROM components
-                GROUP BY lifecycle_status
+                GROUP BY 1
             ''').fetchall()
             
             if data:
-                statuses = [d[0] or "Unknown" for d in data]
-                counts = [d[1] for d in data]
-                color_map = {
-                    'Active': self.accent_green,
-                    'NRND': self.accent_orange,
-                    'EOL': self.accent_orange,
-                    'Obsolete': self.accent_red
-                }
-                colors = [color_map.get(s, self.accent) for s in statuses]
+                statuses, counts = zip(*data)
+                colors = [self.lifecycle_colors.get(s, self.accent) for s in statuses]
                 ax.bar(statuses, counts, color=colors)
                 ax.set_xlabel('Lifecycle Status', color=self.text_color)
                 ax.set_ylabel('Count', color=self.text_color)
@@ -667,9 +1088,8 @@ class HardwareEngineeringWorkbench:
             ''').fetchall()
             
             if data:
-                mpns = [d[0][:20] for d in data]
-                stock = [d[1] for d in data]
-                min_stock = [d[2] for d in data]
+                mpns, stock, min_stock = zip(*data)
+                mpns = [mpn[:20] for mpn in mpns]
                 
                 x = range(len(mpns))
                 width = 0.35
@@ -687,13 +1107,12 @@ class HardwareEngineeringWorkbench:
         canvas = FigureCanvasTkAgg(fig, master=self.chart_container)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._chart_cache[chart_type] = (version, canvas)
 
     # Continuing from previous code...
 
-    def create_components_tab(self):
+    def create_components_tab(self, components):
         #Component library with lifecycle tracking#
-        components = tk.Frame(self.notebook, bg=self.bg_dark)
-        self.notebook.add(components, text="🔌 Components")
         
         # Toolbar
         toolbar = tk.Frame(components, bg=self.bg_medium)
@@ -719,7 +1138,8 @@ class HardwareEngineeringWorkbench:
         tk.Label(toolbar, text="Search:", bg=self.bg_medium, fg=self.text_color).pack(side=tk.LEFT, padx=(20,5))
         self.component_search = tk.Entry(toolbar, width=30)
         self.component_search.pack(side=tk.LEFT, padx=5)
-        self.component_search.bind('<KeyRelease>', lambda e: self.search_components())
+        self._search_after_id = None
+        self.component_search.bind('<KeyRelease>', lambda e: self.schedule_search())
         
         # Treeview
         tree_frame = tk.Frame(components, bg=self.bg_dark)
@@ -734,6 +1154,10 @@ class HardwareEngineeringWorkbench:
         col_widths = {"MPN": 120, "Manufacturer": 120, "Description": 200, "Category": 100,
                     "Stock": 70, "Price": 80, "Lifecycle": 90, "Last Checked": 120}
         
+        # Column -> next sort is descending; sort_components toggles it
+        self._sort_dir = {}
+        # (column, descending) the paged view is ordered by; None is MPN order
+        self._components_sort = None
         for col in columns:
             self.components_tree.heading(col, text=col, command=lambda c=col: self.sort_components(c))
             self.components_tree.column(col, width=col_widths.get(col, 100))
@@ -741,7 +1165,11 @@ class HardwareEngineeringWorkbench:
         # Scrollbars
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.components_tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.components_tree.xview)
-        self.components_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        # Scrolling near the end (wheel, keys or scrollbar) loads the next page of rows
+        self._components_vsb = vsb
+        self._components_exhausted = True
+        self._components_page_pending = False
+        self.components_tree.configure(yscrollcommand=self._on_components_yscroll, xscrollcommand=hsb.set)
         
         self.components_tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -750,6 +1178,11 @@ class HardwareEngineeringWorkbench:
         tree_frame.rowconfigure(0, weight=1)
         tree_frame.columnconfigure(0, weight=1)
         
+        # Row colors, configured once rather than on every refresh
+        self.components_tree.tag_configure('obsolete', background='#ff6666')
+        self.components_tree.tag_configure('eol', background='#ffaa66')
+        self.components_tree.tag_configure('lowstock', background='#ffff99')
+        
         # Context menu
         self.components_tree.bind("<Button-3>", self.show_component_context_menu)
         self.components_tree.bind("<Double-1>", self.edit_component)
@@ -758,51 +1191,56 @@ class HardwareEngineeringWorkbench:
 
     def update_category_filter(self):
         #Update category filter dropdown#
-        categories = self.cursor.execute('''
-            SELECT DISTINCT category FROM components WHERE category != '' ORDER BY category
-        ''').fetchall()
-        
-        category_list = ["All Categories"] + [c[0] for c in categories]
-        self.category_filter['values'] = category_list
+        if not hasattr(self, 'category_filter'):
+            return
+        version = self._view_version()
+        if self._cache.get("categories") != version:
+            # Served as a covering scan of idx_comp_category_mpn
+            categories = self.cursor.execute('''
+                SELECT DISTINCT category FROM components WHERE category != '' ORDER BY category
+            ''')
+            
+            category_list = ["All Categories"] + [c[0] for c in categories]
+            self.category_filter['values'] = category_list
+            self._cache["categories"] = version
         self.category_filter.set("All Categories")
 
     def filter_components(self):
         #Filter components by category#
         category = self.category_filter.get()
         
-        for item in self.components_tree.get_children():
-            self.components_tree.delete(item)
-        
         if category == "All Categories":
-            query = '''SELECT id, mpn, manufacturer, description, category, stock_qty, 
-                    unit_price, lifecycle_status, last_checked FROM components ORDER BY mpn'''
-            components = self.cursor.execute(query).fetchall()
+            self._show_component_pages("", ())
         else:
-            query = '''SELECT id, mpn, manufacturer, description, category, stock_qty, 
-                    unit_price, lifecycle_status, last_checked FROM components 
-                    WHERE category = ? ORDER BY mpn'''
-            components = self.cursor.execute(query, (category,)).fetchall()
-        
-        for comp in components:
-            values = (comp[1], comp[2], comp[3], comp[4], comp[5], f"${comp[6]:.2f}", comp[7], comp[8] or "Never")
-            item = self.components_tree.insert("", tk.END, text=comp[0], values=values)
-            
-            # Color coding
-            if comp[7] == 'Obsolete':
-                self.components_tree.item(item, tags=('obsolete',))
-            elif comp[7] in ['EOL', 'NRND']:
-                self.components_tree.item(item, tags=('eol',))
-            elif comp[5] < self.cursor.execute("SELECT min_stock FROM components WHERE id=?", (comp[0],)).fetchone()[0]:
-                self.components_tree.item(item, tags=('lowstock',))
-        
-        self.components_tree.tag_configure('obsolete', background='#ff6666')
-        self.components_tree.tag_configure('eol', background='#ffaa66')
-        self.components_tree.tag_configure('lowstock', background='#ffff99')
+            self._show_component_pages("WHERE category = ?", (category,))
 
     def sort_components(self, column):
-        #Sort components by column#
-        # Simple implementation - could be enhanced
-        self.refresh_components()
+        #Sort components by column; clicking again reverses the order#
+        reverse = self._sort_dir.get(column, False)
+        self._sort_dir[column] = not reverse
+        if self._components_view is not None:
+            # Paged catalog: re-page from the database in the new order instead of
+            # loading every remaining page into the tree to sort it here
+            self._components_sort = (column, reverse)
+            self._show_component_pages(*self._components_view)
+            return
+        
+        # Search results are loaded in full, so sort the rows already in the tree
+        tree = self.components_tree
+        rows = [(tree.set(item, column), item) for item in tree.get_children('')]
+        if column in ("Stock", "Price"):
+            def key(row):
+                try:
+                    return float(str(row[0]).lstrip('$'))
+                except ValueError:
+                    return float('-inf')  # Empty/None values sort first
+        else:
+            def key(row):
+                return str(row[0]).lower()
+        rows.sort(key=key, reverse=reverse)
+        
+        for index, (_, item) in enumerate(rows):
+            tree.move(item, '', index)
 
     def update_prices_octopart(self):
         #Update component prices from Octopart API#
@@ -821,73 +1259,89 @@ class HardwareEngineeringWorkbench:
         
         # Real Octopart API integration
         self.set_status("Updating prices from Octopart...", True)
-        
+
+        components = self.cursor.execute(
+            "SELECT id, mpn, manufacturer FROM components LIMIT 10"
+        ).fetchall()
+
+        def fetch_chunk(chunk):
+            # One batched query per OCTOPART_BATCH_SIZE parts
+            try:
+                headers = {
+                    "Authorization": f"Token {api_key}",
+                    "Content-Type": "application/json"
+                }
+
+                query = {
+                    "query": OCTOPART_MULTI_MATCH_QUERY,
+                    "variables": {
+                        "queries": [{"mpn": mpn, "manufacturer": manufacturer}
+                                    for _, mpn, manufacturer in chunk]
+                    }
+                }
+
+                # NOTE: This is example code - actual API format may vary
+                # import requests  # not loaded at startup; only the real API path needs it
+                # response = requests.post(OCTOPART_URL, json=query, headers=headers, timeout=10)
+
+                # For demo purposes, simulate a response
+                # In production, uncomment above and parse real response
+                # One draw per chunk: prices as whole cents in $0.10-$50.00, then lifecycles
+                n = len(chunk)
+                simulated_prices = [cents / 100 for cents in random.choices(range(10, 5001), k=n)]
+                simulated_lifecycles = random.choices(['Active', 'Active', 'Active', 'NRND', 'EOL'], k=n)
+                return [(comp_id, price, lifecycle) for (comp_id, _, _), price, lifecycle
+                        in zip(chunk, simulated_prices, simulated_lifecycles)]
+
+            except Exception as e:
+                print(f"Failed to update {', '.join(c[1] for c in chunk)}: {e}")
+                return []
+
         def update_worker():
             try:
-                components = self.cursor.execute(
-                    "SELECT id, mpn, manufacturer FROM components LIMIT 10"
-                ).fetchall()
-                
-                updated_count = 0
-                
-                for comp_id, mpn, manufacturer in components:
-                    try:
-                        # Octopart API v4 endpoint
-                        url = "https://octopart.com/api/v4/endpoint"
-                        
-                        headers = {
-                            "Authorization": f"Token {api_key}",
-                            "Content-Type": "application/json"
-                        }
-                        
-                        # Query for part
-                        query = {
-                            "query": f'mpn:"{mpn}" AND manufacturer.name:"{manufacturer}"',
-                            "limit": 1
-                        }
-                        
-                        # NOTE: This is example code - actual API format may vary
-                        # response = requests.post(url, json=query, headers=headers, timeout=10)
-                        
-                        # For demo purposes, simulate a response
-                        # In production, uncomment above and parse real response
-                        import random
-                        simulated_price = round(random.uniform(0.10, 50.00), 2)
-                        simulated_lifecycle = random.choice(['Active', 'Active', 'Active', 'NRND', 'EOL'])
-                        
-                        # Update database
-                        self.cursor.execute('''
-                            UPDATE components 
-                            SET unit_price = ?, lifecycle_status = ?, last_checked = ?
-                            WHERE id = ?
-                        ''', (simulated_price, simulated_lifecycle, datetime.now(), comp_id))
-                        
-                        # Log price history
-                        self.cursor.execute('''
-                            INSERT INTO price_history (component_id, price, source)
-                            VALUES (?, ?, 'Octopart')
-                        ''', (comp_id, simulated_price))
-                        
-                        updated_count += 1
-                        
-                    except Exception as e:
-                        print(f"Failed to update {mpn}: {e}")
-                        continue
-                
-                self.conn.commit()
-                
-                self.root.after(0, lambda: self.set_status(f"Updated {updated_count} components", False))
-                self.root.after(0, self.refresh_components)
-                self.root.after(0, self.update_alerts)
-                
+                chunks = [components[i:i + OCTOPART_BATCH_SIZE]
+                          for i in range(0, len(components), OCTOPART_BATCH_SIZE)]
+                with ThreadPoolExecutor(max_workers=OCTOPART_WORKERS) as pool:
+                    results = [row for rows in pool.map(fetch_chunk, chunks) for row in rows]
+
+                # Database writes stay on the Tk thread that owns the connection
+                self.root.after(0, self._apply_price_updates, results)
+
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Price update failed: {str(e)}"))
+                error = str(e)
+                self.root.after(0, lambda: messagebox.showerror("Error", f"Price update failed: {error}"))
                 self.root.after(0, lambda: self.set_status("Price update failed", False))
-        
+
         # Run in background thread
         thread = threading.Thread(target=update_worker, daemon=True)
         thread.start()
 
+    def _apply_price_updates(self, results):
+        #Write fetched prices back in a single transaction#
+        now = _db_timestamp()
+        try:
+            # Take the write lock up front rather than upgrading a read lock mid-batch
+            if not self.conn.in_transaction:
+                self.cursor.execute("BEGIN IMMEDIATE")
+            self.cursor.executemany(
+                SQL_UPDATE_PRICE, [(price, lifecycle, now, comp_id) for comp_id, price, lifecycle in results]
+            )
+
+            # Log price history
+            self.cursor.executemany(SQL_INSERT_PRICE_HISTORY, [(comp_id, price) for comp_id, price, _ in results])
+
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            messagebox.showerror("Error", f"Price update failed: {str(e)}")
+            self.set_status("Price update failed", False)
+            return
+
+        self._mark_dirty()
+        self.set_status(f"Updated {len(results)} components", False)
+        self.refresh_components()
+        self.update_alerts()
+
     def generate_report(self):
         #Generate PDF or HTML report#
         project_name = self.project_var.get() if hasattr(self, 'project_var') and self.project_var.get() else None
@@ -896,26 +1350,39 @@ class HardwareEngineeringWorkbench:
             messagebox.showinfo("Generate Report", "Please select a project in the BOM Manager tab first")
             return
         
-        project = self.cursor.execute("SELECT id FROM projects WHERE name=?", (project_name,)).fetchone()
-        if not project:
+        project_id = self._project_ids().get(project_name)
+        if project_id is None:
             return
         
-        project_id = project[0]
-        
-        # Generate HTML report (works without extra dependencies)
+        # Generate HTML report (works without extra dependencies) off the Tk thread
+        filename = f"BOM_Report_{project_name}_{datetime.now().strftime('%Y%m%d')}.html"
+        self.set_status(f"Generating report for {project_name}...", True)
+        threading.Thread(target=self._write_report, args=(project_id, project_name, filename),
+                         daemon=True).start()
+
+    def _write_report(self, project_id, project_name, filename):
+        #Query the BOM and write the HTML report (worker thread)#
         try:
-            bom_items = self.cursor.execute('''
-                SELECT b.reference_designator, c.mpn, c.manufacturer, c.description, 
-                    b.quantity, c.unit_price, c.lifecycle_status, c.datasheet_url
-                FROM bom b
-                JOIN components c ON b.component_id = c.id
-                WHERE b.project_id = ?
-                ORDER BY b.reference_designator
-            ''', (project_id,)).fetchall()
-            
-            total_cost = sum(item[4] * item[5] for item in bom_items)
+            # sqlite3 connections are bound to their thread, so read through a private one
+            conn = sqlite3.connect('file:hardware_workbench.db?mode=ro', uri=True)
+            try:
+                cursor = conn.cursor()
+                bom_items = cursor.execute('''
+                    SELECT b.reference_designator, c.mpn, c.manufacturer, c.description, 
+                        b.quantity, c.unit_price, c.lifecycle_status, c.datasheet_url
+                    FROM bom b
+                    JOIN components c ON b.component_id = c.id
+                    WHERE b.project_id = ?
+                    ORDER BY b.reference_designator
+                ''', (project_id,)).fetchall()
+                
+                total_cost = self.bom_unit_cost(project_id, cursor)
+            finally:
+                conn.close()
             
-            html_content = f"""
+            # Stream straight to the file rather than growing one big string
+            with open(filename, 'w', buffering=1 << 20) as f:
+                f.write(f"""
             <!DOCTYPE html>
             <html>
             <head>
@@ -948,33 +1415,23 @@ class HardwareEngineeringWorkbench:
                         <th>Lifecycle</th>
                         <th>Datasheet</th>
                     </tr>
-            """
+                """)
             
-            for item in bom_items:
-                ext_price = item[4] * item[5]
-                row_class = ""
-                if item[6] == "Obsolete":
-                    row_class = ' class="obsolete"'
-                elif item[6] in ["EOL", "NRND"]:
-                    row_class = ' class="eol"'
+                for item in bom_items:
+                    ext_price = item[4] * item[5]
+                    row_class = ""
+                    if item[6] == "Obsolete":
+                        row_class = ' class="obsolete"'
+                    elif item[6] in ["EOL", "NRND"]:
+                        row_class = ' class="eol"'
                 
-                datasheet_link = f'<a href="{item[7]}" target="_blank">PDF</a>' if item[7] else '-'
+                    datasheet_link = f'<a href="{item[7]}" target="_blank">PDF</a>' if item[7] else '-'
                 
-                html_content += f"""
-                    <tr{row_class}>
-                        <td>{item[0]}</td>
-                        <td>{item[1]}</td>
-                        <td>{item[2]}</td>
-                        <td>{item[3]}</td>
-                        <td>{item[4]}</td>
-                        <td>${item[5]:.2f}</td>
-                        <td>${ext_price:.2f}</td>
-                        <td>{item[6]}</td>
-                        <td>{datasheet_link}</td>
-                    </tr>
-                """
+                    f.write(REPORT_ROW_HTML.format(
+                        cls=row_class, ref=item[0], mpn=item[1], mfg=item[2], desc=item[3], qty=item[4],
+                        unit=item[5], ext=ext_price, lifecycle=item[6], datasheet=datasheet_link))
             
-            html_content += f"""
+                f.write(f"""
                 </table>
                 
                 <div class="summary">
@@ -990,21 +1447,24 @@ class HardwareEngineeringWorkbench:
                 </p>
             </body>
             </html>
-            """
-            
-            # Save report
-            filename = f"BOM_Report_{project_name}_{datetime.now().strftime('%Y%m%d')}.html"
-            with open(filename, 'w') as f:
-                f.write(html_content)
-            
-            # Open in browser
-            webbrowser.open(filename)
-            
-            messagebox.showinfo("Success", f"Report generated: {filename}")
-            self.log_activity("Generated Report", project_name)
+                """)
             
+            self.root.after(0, self._report_done, filename, project_name)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate report: {str(e)}")
+            self.root.after(0, self._report_failed, str(e))
+
+    def _report_done(self, filename, project_name):
+        #Open the finished report (Tk thread)#
+        self.set_status(f"Report generated: {filename}", False)
+        webbrowser.open(filename)
+        
+        messagebox.showinfo("Success", f"Report generated: {filename}")
+        self.log_activity("Generated Report", project_name)
+
+    def _report_failed(self, error):
+        #Report a failed report (Tk thread)#
+        self.set_status("Report generation failed", False)
+        messagebox.showerror("Error", f"Failed to generate report: {error}")
 
     def show_settings(self):
         #Show settings dialog#
@@ -1013,7 +1473,7 @@ class HardwareEngineeringWorkbench:
         dialog.geometry("600x500")
         dialog.configure(bg=self.bg_dark)
         
-        notebook = ttk.Notebook(dialog)
+        notebook = ttk.Notebook(dialog, style=f"{self._current_palette}.TNotebook")
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # General tab
@@ -1134,7 +1594,16 @@ class HardwareEngineeringWorkbench:
             self.settings["theme"] = "dark"
         
         self.save_settings()
-        messagebox.showinfo("Theme Changed", "Please restart the application for theme changes to take effect.")
+        
+        # Styles for both palettes already exist, so only the ttk style names change.
+        # The tk colors (bg_*, accent*, chart colors) keep the startup palette until restart.
+        self._current_palette = self.settings["theme"].capitalize()
+        self._styled_widgets = [(w, base) for w, base in self._styled_widgets if w.winfo_exists()]
+        for widget, base in self._styled_widgets:
+            widget.configure(style=f"{self._current_palette}.{base}")
+        
+        messagebox.showinfo("Theme Changed", "Tabs have been restyled.\n\n"
+                            "Please restart the application for the theme to apply to all other widgets.")
 
     def startup_checks(self):
         #Run checks on startup#
@@ -1176,18 +1645,32 @@ class HardwareEngineeringWorkbench:
         """
         messagebox.showinfo("Keyboard Shortcuts", shortcuts_text)
 
-        def manual_backup(self):
+    def manual_backup(self):
         #Manual database backup#
-            try:
-                backup_dir = filedialog.askdirectory(title="Select Backup Location")
-                if backup_dir:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    backup_file = os.path.join(backup_dir, f"hardware_workbench_{timestamp}.db")
-                    shutil.copy2("hardware_workbench.db", backup_file)
-                    messagebox.showinfo("Success", f"Backup created:\n{backup_file}")
-                    self.log_activity("Manual Backup", backup_file)
-            except Exception as e:
-                messagebox.showerror("Error", f"Backup failed: {str(e)}")
+        backup_dir = filedialog.askdirectory(title="Select Backup Location")
+        if backup_dir:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_file = os.path.join(backup_dir, f"hardware_workbench_{timestamp}.db")
+            self._flush_log()  # Include activity still waiting in the buffer
+            self.set_status("Backing up database...", True)
+            threading.Thread(target=self._do_manual_backup, args=(backup_file,), daemon=True).start()
+
+    def _do_manual_backup(self, backup_file):
+        #Copy the database for manual_backup and report back on the Tk thread#
+        try:
+            self._copy_database(backup_file)
+        except Exception as e:
+            error = str(e)
+            self.root.after(0, lambda: messagebox.showerror("Error", f"Backup failed: {error}"))
+            self.root.after(0, self.set_status, "Backup failed", False)
+            return
+        self.root.after(0, self._manual_backup_done, backup_file)
+
+    def _manual_backup_done(self, backup_file):
+        #Confirm a finished manual backup#
+        self.set_status("Backup created", False)
+        messagebox.showinfo("Success", f"Backup created:\n{backup_file}")
+        self.log_activity("Manual Backup", backup_file)
 
     def restore_backup(self):
         #Restore from backup#
@@ -1201,10 +1684,18 @@ class HardwareEngineeringWorkbench:
                                 "This will replace your current database.\n\n"
                                 "Are you sure you want to continue?"):
                 try:
+                    self._flush_log()
+                    # Copy pages into the open connection; unlike overwriting the file,
+                    # this can't leave a stale -wal/-shm pair applied over the restored data
+                    src = sqlite3.connect(backup_file)
+                    try:
+                        src.backup(self.conn)
+                    finally:
+                        src.close()
                     self.conn.close()
-                    shutil.copy2(backup_file, "hardware_workbench.db")
-                    self.conn = sqlite3.connect('hardware_workbench.db')
-                    self.cursor = self.conn.cursor()
+                    # Re-run the schema setup in case the backup predates newer tables/indexes
+                    self.init_database()
+                    self._mark_dirty()
                     self.refresh_all()
                     messagebox.showinfo("Success", "Database restored successfully!")
                     self.log_activity("Restored Backup", backup_file)
@@ -1216,10 +1707,8 @@ class HardwareEngineeringWorkbench:
 
     # ... [Include all methods from previous version] ...
 
-    def create_bom_tab(self):
+    def create_bom_tab(self, bom):
         #BOM management - keeping from v1.0#
-        bom = tk.Frame(self.notebook, bg=self.bg_dark)
-        self.notebook.add(bom, text="📋 BOM Manager")
         
         selector_frame = tk.Frame(bom, bg=self.bg_medium)
         selector_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -1269,10 +1758,8 @@ class HardwareEngineeringWorkbench:
         
         self.refresh_projects_combo()
 
-    def create_projects_tab(self):
+    def create_projects_tab(self, projects):
         #Projects - keeping from v1.0#
-        projects = tk.Frame(self.notebook, bg=self.bg_dark)
-        self.notebook.add(projects, text="📁 Projects")
         
         toolbar = tk.Frame(projects, bg=self.bg_medium)
         toolbar.pack(fill=tk.X, padx=5, pady=5)
@@ -1308,10 +1795,8 @@ class HardwareEngineeringWorkbench:
         
         self.refresh_projects()
 
-    def create_tools_tab(self):
+    def create_tools_tab(self, tools):
         #Tools tab - keeping from v1.0#
-        tools = tk.Frame(self.notebook, bg=self.bg_dark)
-        self.notebook.add(tools, text="🔧 Tools")
         
         tk.Label(tools, text="External Tools Integration", font=("Arial", 18, "bold"),
                 bg=self.bg_dark, fg=self.text_color).pack(pady=20)
@@ -1381,6 +1866,16 @@ class HardwareEngineeringWorkbench:
                     messagebox.showerror("Error", "MPN and Manufacturer are required")
                     return
                 
+                # Convert numeric fields up front so a typo gets a message naming the field
+                numbers = {}
+                for label, convert in (("Stock Qty", int), ("Min Stock", int), ("Unit Price", float)):
+                    text = fields[label].get().strip()
+                    try:
+                        numbers[label] = convert(text) if text else convert(0)
+                    except ValueError:
+                        messagebox.showerror("Error", f"{label} must be a number")
+                        return
+                
                 self.cursor.execute('''
                     INSERT INTO components (mpn, manufacturer, description, category, stock_qty, 
                                         min_stock, unit_price, datasheet_url, notes, last_checked, lifecycle_status)
@@ -1389,21 +1884,21 @@ class HardwareEngineeringWorkbench:
                     mpn, manufacturer,
                     fields["Description"].get().strip(),
                     fields["Category"].get().strip(),
-                    int(fields["Stock Qty"].get() or 0),
-                    int(fields["Min Stock"].get() or 0),
-                    float(fields["Unit Price"].get() or 0.0),
+                    numbers["Stock Qty"], numbers["Min Stock"], numbers["Unit Price"],
                     fields["Datasheet URL"].get().strip(),
                     fields["Notes"].get("1.0", tk.END).strip() if "Notes" in fields else "",
-                    datetime.now(), "Active"
+                    _db_timestamp(), "Active"
                 ))
                 self.conn.commit()
+                self._mark_dirty()
                 messagebox.showinfo("Success", "Component added successfully")
                 dialog.destroy()
                 self.refresh_components()
                 self.update_dashboard_stats()
                 self.update_category_filter()
                 self.log_activity("Added Component", mpn)
-            except Exception as e:
+            except sqlite3.Error as e:
+                self.conn.rollback()
                 messagebox.showerror("Error", f"Failed to add component: {str(e)}")
         
         tk.Button(dialog, text="💾 Save", command=save, bg=self.accent, fg=self.text_color,
@@ -1437,17 +1932,19 @@ class HardwareEngineeringWorkbench:
                     messagebox.showerror("Error", "Project name is required")
                     return
                 
+                now = _db_timestamp()
                 self.cursor.execute('''
                     INSERT INTO projects (name, description, created_date, kicad_path, firmware_path, git_repo, last_opened)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                 ''', (
-                    name, fields["Description"].get().strip(), datetime.now(),
+                    name, fields["Description"].get().strip(), now,
                     fields["KiCad Path"].get().strip(),
                     fields["Firmware Path"].get().strip(),
                     fields["Git Repository"].get().strip(),
-                    datetime.now()
+                    now
                 ))
                 self.conn.commit()
+                self._mark_dirty()
                 messagebox.showinfo("Success", "Project created successfully")
                 dialog.destroy()
                 self.refresh_projects()
@@ -1473,92 +1970,146 @@ class HardwareEngineeringWorkbench:
 
     def refresh_components(self):
         #Refresh components view#
-        for item in self.components_tree.get_children():
-            self.components_tree.delete(item)
-        
-        components = self.cursor.execute('''
-            SELECT id, mpn, manufacturer, description, category, stock_qty, unit_price, lifecycle_status, last_checked
-            FROM components ORDER BY mpn
-        ''').fetchall()
-        
-        for comp in components:
-            values = (comp[1], comp[2], comp[3], comp[4], comp[5], f"${comp[6]:.2f}", comp[7], comp[8] or "Never")
-            item = self.components_tree.insert("", tk.END, text=comp[0], values=values)
-            
-            if comp[7] == 'Obsolete':
-                self.components_tree.item(item, tags=('obsolete',))
-            elif comp[7] in ['EOL', 'NRND']:
-                self.components_tree.item(item, tags=('eol',))
-        
-        self.components_tree.tag_configure('obsolete', background='#ff6666')
-        self.components_tree.tag_configure('eol', background='#ffaa66')
+        if not hasattr(self, 'components_tree'):
+            return  # Tab not built yet; it loads itself when first shown
+        self._show_component_pages("", ())
+
+    def _show_component_pages(self, where, params):
+        #Reset the components tree to the first page of rows matching where#
+        self._components_view = (where, params)
+        self._components_last_key = None
+        self._components_exhausted = False
+        self.components_tree.delete(*self.components_tree.get_children())
+        self._load_component_page()
+
+    def _load_component_page(self):
+        #Append the next COMPONENTS_PAGE_SIZE rows, continuing after the last row shown#
+        self._components_page_pending = False
+        if self._components_exhausted:
+            return
+        where, params = self._components_view
+        column, descending = self._components_sort or ("MPN", False)
+        sort_key = COMPONENT_SORT_KEYS[column]
+        order, op = ("DESC", "<") if descending else ("ASC", ">")
+        if self._components_last_key is not None:
+            # Keyset paging continues after the last row; OFFSET would rescan skipped rows.
+            # MPN order walks the mpn index with a single-column bound.
+            if sort_key == "mpn":
+                bound, bound_params = f"mpn {op} ?", (self._components_last_key[1],)
+            else:
+                bound, bound_params = f"({sort_key}, mpn) {op} (?, ?)", self._components_last_key
+            where = f"{where} AND {bound}" if where else f"WHERE {bound}"
+            params = params + bound_params
+        order_by = f"mpn {order}" if sort_key == "mpn" else f"sort_key {order}, mpn {order}"
+        # Columns 1-8 come back already formatted for display, in the tree's column order
+        rows = self.cursor.execute(f'''
+            SELECT id, mpn, manufacturer, description, category, stock_qty, printf('$%.2f', unit_price),
+                lifecycle_status, COALESCE(last_checked, 'Never'),
+                stock_qty < min_stock AND min_stock > 0 AS low_stock, {sort_key} AS sort_key
+            FROM components {where} ORDER BY {order_by} LIMIT ?
+        ''', params + (COMPONENTS_PAGE_SIZE,)).fetchall()
+        
+        # No detach here: a page is appended mid-scroll and Tk already redraws once at idle
+        insert = self.components_tree.insert
+        for comp in rows:
+            tags = LIFECYCLE_ROW_TAGS.get(comp["lifecycle_status"]) or (LOW_STOCK_ROW_TAGS if comp["low_stock"] else ())
+            insert("", tk.END, text=comp["id"], values=comp[1:9], tags=tags)
+        
+        if rows:
+            self._components_last_key = (rows[-1]["sort_key"], rows[-1]["mpn"])
+        self._components_exhausted = len(rows) < COMPONENTS_PAGE_SIZE
+
+    def _on_components_yscroll(self, first, last):
+        #Keep the scrollbar in sync and fetch another page once the end is in view#
+        self._components_vsb.set(first, last)
+        if float(last) >= 1.0 and not self._components_exhausted and not self._components_page_pending:
+            self._components_page_pending = True
+            self.root.after_idle(self._load_component_page)
 
     def refresh_projects(self):
         #Refresh projects#
-        for item in self.projects_tree.get_children():
-            self.projects_tree.delete(item)
+        if not hasattr(self, 'projects_tree'):
+            return
+        self.projects_tree.delete(*self.projects_tree.get_children())
         
+        # Iterate the cursor directly instead of building a list first
         projects = self.cursor.execute('''
             SELECT id, name, description, created_date, kicad_path, firmware_path, git_repo
             FROM projects ORDER BY created_date DESC
-        ''').fetchall()
+        ''')
         
+        insert = self.projects_tree.insert
         for proj in projects:
-            values = (proj[1], proj[2], proj[3], proj[4], proj[5], proj[6])
-            self.projects_tree.insert("", tk.END, text=proj[0], values=values)
+            insert("", tk.END, text=proj[0], values=proj[1:])
 
     def refresh_projects_combo(self):
         #Refresh combo#
         if hasattr(self, 'project_combo'):
-            projects = self.cursor.execute("SELECT name FROM projects ORDER BY name").fetchall()
-            self.project_combo['values'] = [p[0] for p in projects]
+            self.project_combo['values'] = sorted(self._project_ids())
+
+    def _project_ids(self):
+        #Project name -> id, cached until the next write (same key as the dashboard views)#
+        version = self._view_version()
+        cached = self._cache.get("project_ids")
+        if cached is None or cached[0] != version:
+            cached = (version, dict(self.cursor.execute("SELECT name, id FROM projects")))
+            self._cache["project_ids"] = cached
+        return cached[1]
 
     def load_bom(self):
         #Load BOM#
+        if not hasattr(self, 'project_var'):
+            return
         project_name = self.project_var.get()
         if not project_name:
             return
         
-        for item in self.bom_tree.get_children():
-            self.bom_tree.delete(item)
+        self.bom_tree.delete(*self.bom_tree.get_children())
         
-        project = self.cursor.execute("SELECT id FROM projects WHERE name=?", (project_name,)).fetchone()
-        if not project:
+        project_id = self._project_ids().get(project_name)
+        if project_id is None:
             return
         
-        bom_items = self.cursor.execute('''
-            SELECT b.reference_designator, c.mpn, c.manufacturer, c.description, 
-                b.quantity, c.unit_price, c.lifecycle_status
+        # Rows come back formatted for display, in the tree's column order
+        cursor = self.cursor.execute('''
+            SELECT b.reference_designator, c.mpn, c.manufacturer, c.description, b.quantity,
+                printf('$%.2f', c.unit_price), printf('$%.2f', b.quantity * c.unit_price), c.lifecycle_status
             FROM bom b
             JOIN components c ON b.component_id = c.id
             WHERE b.project_id = ?
             ORDER BY b.reference_designator
-        ''', (project[0],)).fetchall()
+        ''', (project_id,))
         
-        total_cost = 0
-        for i, item in enumerate(bom_items, 1):
-            ext_price = item[4] * item[5]
-            total_cost += ext_price
-            values = (item[0], item[1], item[2], item[3], item[4], f"${item[5]:.2f}", f"${ext_price:.2f}", item[6])
-            self.bom_tree.insert("", tk.END, text=i, values=values)
+        self.bom_tree.grid_remove()
+        insert = self.bom_tree.insert
+        for i, item in enumerate(cursor, 1):
+            insert("", tk.END, text=i, values=tuple(item))
+        self.bom_tree.grid()
         
+        total_cost = self.bom_unit_cost(project_id)
         self.bom_cost_label.config(text=f"Total Cost per Unit: ${total_cost:.2f}")
 
     def update_dashboard_stats(self):
         #Update stats#
-        projects_count = self.cursor.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
-        components_count = self.cursor.execute("SELECT COUNT(*) FROM components").fetchone()[0]
-        low_stock = self.cursor.execute("SELECT COUNT(*) FROM components WHERE stock_qty < min_stock AND min_stock > 0").fetchone()[0]
-        obsolete = self.cursor.execute("SELECT COUNT(*) FROM components WHERE lifecycle_status IN ('Obsolete', 'EOL')").fetchone()[0]
-        
-        if hasattr(self, 'stat_projects'):
-            self.stat_projects.config(text=str(projects_count))
-        if hasattr(self, 'stat_components'):
-            self.stat_components.config(text=str(components_count))
-        if hasattr(self, 'stat_low_stock_alerts'):
-            self.stat_low_stock_alerts.config(text=str(low_stock))
-        if hasattr(self, 'stat_obsolete_parts'):
-            self.stat_obsolete_parts.config(text=str(obsolete))
+        version = self._view_version()
+        if self._cache.get("stats") == version:
+            return
+        projects_count, components_count, low_stock, obsolete = self.cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM projects),
+                (SELECT COUNT(*) FROM components),
+                (SELECT COUNT(*) FROM components WHERE stock_qty < min_stock AND min_stock > 0),
+                (SELECT COUNT(*) FROM components WHERE lifecycle_status IN ('Obsolete', 'EOL'))
+        ''').fetchone()
+        
+        # Most writes leave the counters alone, so only touch labels whose value moved
+        for title, value in (("Projects", projects_count), ("Components", components_count),
+                             ("Low Stock Alerts", low_stock), ("Obsolete Parts", obsolete)):
+            if self._last_stats.get(title) != value:
+                self.stat_labels[title].config(text=str(value))
+                self._last_stats[title] = value
+        
+        self._cache["stats"] = version
 
     # Include all remaining methods: import_bom, search_components, launch_external, etc.
     def import_bom(self):
@@ -1570,8 +2121,8 @@ class HardwareEngineeringWorkbench:
         if not file_path:
             return
             
-        projects = self.cursor.execute("SELECT id, name FROM projects").fetchall()
-        if not projects:
+        project_ids = self._project_ids()
+        if not project_ids:
             messagebox.showerror("Error", "Create a project first")
             return
         
@@ -1582,17 +2133,21 @@ class HardwareEngineeringWorkbench:
         
         tk.Label(dialog, text="Select Project:", bg=self.bg_dark, fg=self.text_color).pack(pady=10)
         project_var = tk.StringVar()
-        combo = ttk.Combobox(dialog, textvariable=project_var, values=[p[1] for p in projects])
+        combo = ttk.Combobox(dialog, textvariable=project_var, values=sorted(project_ids))
         combo.pack(pady=10)
         
         def do_import():
-            import csv
             project_name = project_var.get()
             if not project_name:
                 return
-            project_id = next(p[0] for p in projects if p[1] == project_name)
+            project_id = project_ids.get(project_name)
+            if project_id is None:
+                return
             
             try:
+                now = _db_timestamp()
+                new_components = []
+                lines = []
                 with open(file_path, 'r') as f:
                     reader = csv.DictReader(f)
                     for row in reader:
@@ -1600,63 +2155,128 @@ class HardwareEngineeringWorkbench:
                         if not mpn:
                             continue
                         
-                        comp = self.cursor.execute("SELECT id FROM components WHERE mpn=?", (mpn,)).fetchone()
-                        if not comp:
-                            self.cursor.execute('''
-                                INSERT INTO components (mpn, manufacturer, description, last_checked, lifecycle_status, unit_price)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            ''', (mpn, row.get('Manufacturer', ''), row.get('Description', ''), 
-                                datetime.now(), 'Active', float(row.get('Price', 0) or 0)))
-                            comp_id = self.cursor.lastrowid
-                        else:
-                            comp_id = comp[0]
-                        
-                        self.cursor.execute('''
-                            INSERT OR REPLACE INTO bom (project_id, component_id, reference_designator, quantity)
-                            VALUES (?, ?, ?, ?)
-                        ''', (project_id, comp_id, row.get('Reference', ''), int(row.get('Qty', 1))))
+                        new_components.append((mpn, row.get('Manufacturer', ''), row.get('Description', ''),
+                                            now, 'Active', float(row.get('Price', 0) or 0)))
+                        lines.append((mpn, row.get('Reference', ''), int(row.get('Qty', 1))))
+                
+                # One write transaction for the whole file, locked up front like the price write-back
+                if not self.conn.in_transaction:
+                    self.cursor.execute("BEGIN IMMEDIATE")
+                
+                # Unknown MPNs are created from their first row; existing parts are left alone
+                self.cursor.executemany('''
+                    INSERT OR IGNORE INTO components (mpn, manufacturer, description, last_checked, lifecycle_status, unit_price)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', new_components)
+                
+                # Resolve MPNs to ids in chunks that stay under SQLite's bound-parameter limit
+                mpns = list({mpn for mpn, _, _ in lines})
+                comp_ids = {}
+                for i in range(0, len(mpns), IMPORT_LOOKUP_CHUNK):
+                    chunk = mpns[i:i + IMPORT_LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    comp_ids.update(self.cursor.execute(
+                        f"SELECT mpn, id FROM components WHERE mpn IN ({placeholders})", chunk
+                    ).fetchall())
+                
+                self.cursor.executemany('''
+                    INSERT OR REPLACE INTO bom (project_id, component_id, reference_designator, quantity)
+                    VALUES (?, ?, ?, ?)
+                ''', [(project_id, comp_ids[mpn], ref, qty) for mpn, ref, qty in lines])
                 
                 self.conn.commit()
+                self._mark_dirty()
+                # Refresh planner statistics after a bulk load; the import is already committed
+                try:
+                    self.cursor.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    print(f"PRAGMA optimize failed: {e}")
                 messagebox.showinfo("Success", "BOM imported")
                 dialog.destroy()
                 self.refresh_components()
                 self.load_bom()
                 self.log_activity("Imported BOM", project_name)
             except Exception as e:
+                self.conn.rollback()
                 messagebox.showerror("Error", f"Import failed: {str(e)}")
         
         tk.Button(dialog, text="Import", command=do_import, bg=self.accent,
                 fg=self.text_color, relief=tk.FLAT, padx=20, pady=8).pack(pady=10)
 
+    def schedule_search(self):
+        #Debounce search box keystrokes#
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.search_components)
+
     def search_components(self):
         #Search components#
+        self._search_after_id = None
         keyword = self.component_search.get().lower()
-        for item in self.components_tree.get_children():
-            self.components_tree.delete(item)
-        
-        components = self.cursor.execute('''
-            SELECT id, mpn, manufacturer, description, category, stock_qty, unit_price, lifecycle_status, last_checked
-            FROM components 
-            WHERE LOWER(mpn) LIKE ? OR LOWER(manufacturer) LIKE ? OR LOWER(description) LIKE ?
-        ''', (f'%{keyword}%', f'%{keyword}%', f'%{keyword}%')).fetchall()
+        if not keyword.strip():
+            # Cleared box: back to the paged catalog instead of loading every row
+            self._show_component_pages("", ())
+            return
+        self._components_exhausted = True  # Results are loaded in full, not paged
+        self._components_view = None
+        self.components_tree.delete(*self.components_tree.get_children())
+        
+        if self.has_fts and len(keyword.strip()) >= 3:
+            # Quoted so FTS5 operators typed by the user are matched literally
+            term = '"' + keyword.strip().replace('"', '""') + '"'
+            components = self.cursor.execute('''
+                SELECT c.id, c.mpn, c.manufacturer, c.description, c.category, c.stock_qty,
+                    printf('$%.2f', c.unit_price), c.lifecycle_status, COALESCE(c.last_checked, 'Never')
+                FROM components_fts f
+                JOIN components c ON c.id = f.rowid
+                WHERE components_fts MATCH ?
+                ORDER BY rank
+            ''', (term,)).fetchall()
+        else:
+            # Trigrams need at least three characters. LIKE already ignores ASCII case,
+            # and % or _ typed by the user are escaped so they match literally.
+            pattern = '%' + keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            components = self.cursor.execute('''
+                SELECT id, mpn, manufacturer, description, category, stock_qty, printf('$%.2f', unit_price),
+                    lifecycle_status, COALESCE(last_checked, 'Never')
+                FROM components
+                WHERE mpn LIKE ?1 ESCAPE '\\' OR manufacturer LIKE ?1 ESCAPE '\\' OR description LIKE ?1 ESCAPE '\\'
+            ''', (pattern,)).fetchall()
         
+        # Detach the tree while inserting so Tk lays it out once
+        self.components_tree.grid_remove()
+        insert = self.components_tree.insert
         for comp in components:
-            values = (comp[1], comp[2], comp[3], comp[4], comp[5], f"${comp[6]:.2f}", comp[7], comp[8] or "Never")
-            self.components_tree.insert("", tk.END, text=comp[0], values=values)
+            insert("", tk.END, text=comp[0], values=comp[1:])
+        self.components_tree.grid()
 
     def launch_external(self, command):
-        #Launch external tool#
+        #Launch external tool; process creation runs off the Tk thread#
+        threading.Thread(target=self._do_launch_external, args=(command,), daemon=True).start()
+
+    def _do_launch_external(self, command):
+        #Start the tool and report back on the Tk thread#
         try:
             subprocess.Popen(command, shell=True if os.name == 'nt' else False)
-            self.log_activity("Launched Tool", command)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to launch {command}: {str(e)}")
+            error = str(e)
+            self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to launch {command}: {error}"))
+            return
+        self.root.after(0, self.log_activity, "Launched Tool", command)
 
     def check_lifecycle(self):
         #Check lifecycle#
         messagebox.showinfo("Lifecycle Check", 
                         "In production:\n• Query Octopart API\n• Check lifecycle\n• Update database\n\nAPI key required.")
 
+    def bom_unit_cost(self, project_id, cursor=None):
+        #Per-unit BOM cost, summed inside SQLite#
+        return (cursor or self.cursor).execute('''
+            SELECT COALESCE(SUM(b.quantity * c.unit_price), 0)
+            FROM bom b JOIN components c ON b.component_id = c.id
+            WHERE b.project_id = ?
+        ''', (project_id,)).fetchone()[0]
+
     def cost_analysis(self):
         #Cost analysis#
         project_name = self.project_var.get() if hasattr(self, 'project_var') else None
@@ -1664,17 +2284,11 @@ class HardwareEngineeringWorkbench:
             messagebox.showinfo("Cost Analysis", "Select a project in BOM Manager")
             return
         
-        project = self.cursor.execute("SELECT id FROM projects WHERE name=?", (project_name,)).fetchone()
-        if not project:
+        project_id = self._project_ids().get(project_name)
+        if project_id is None:
             return
         
-        result = self.cursor.execute('''
-            SELECT SUM(b.quantity * c.unit_price)
-            FROM bom b JOIN components c ON b.component_id = c.id
-            WHERE b.project_id = ?
-        ''', (project[0],)).fetchone()
-        
-        unit_cost = result[0] or 0
+        unit_cost = self.bom_unit_cost(project_id)
         msg = f"Cost Analysis: {project_name}\n\nUnit: ${unit_cost:.2f}\n10x: ${unit_cost*10:.2f}\n100x: ${unit_cost*100:.2f}"
         messagebox.showinfo("Cost Analysis", msg)
 
@@ -1689,9 +2303,10 @@ class HardwareEngineeringWorkbench:
             return
         if messagebox.askyesno("Confirm", "Delete this project?"):
             project_id = self.projects_tree.item(selection[0])['text']
-            self.cursor.execute("DELETE FROM bom WHERE project_id=?", (project_id,))
+            # BOM lines go with it via ON DELETE CASCADE
             self.cursor.execute("DELETE FROM projects WHERE id=?", (project_id,))
             self.conn.commit()
+            self._mark_dirty()
             self.refresh_projects()
             self.refresh_projects_combo()
             self.log_activity("Deleted Project", str(project_id))
@@ -1735,18 +2350,18 @@ class HardwareEngineeringWorkbench:
             comp_id = self.components_tree.item(selection[0])['text']
             self.cursor.execute("DELETE FROM components WHERE id=?", (comp_id,))
             self.conn.commit()
+            self._mark_dirty()
             self.refresh_components()
 
     def export_components(self):
         #Export to CSV#
-        import csv
         file_path = filedialog.asksaveasfilename(defaultextension=".csv")
         if file_path:
-            with open(file_path, 'w', newline='') as f:
+            # Stream rows straight from the cursor through a 1 MB write buffer
+            with open(file_path, 'w', newline='', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow(["MPN", "Manufacturer", "Description", "Stock", "Price"])
-                components = self.cursor.execute("SELECT mpn, manufacturer, description, stock_qty, unit_price FROM components").fetchall()
-                writer.writerows(components)
+                writer.writerows(self.cursor.execute("SELECT mpn, manufacturer, description, stock_qty, unit_price FROM components"))
             messagebox.showinfo("Success", "Exported")
 
     def show_help(self):